@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+CSV Question-Answering over Mandi Price Data
+
+Loads a mandi price CSV, indexes one document per row in a FAISS vector
+store using OpenAI embeddings, and answers questions about the data in a
+simple interactive loop.
+
+SETUP:
+1. Install: pip install langchain-classic langchain-openai langchain-community faiss-cpu pandas pyarrow tiktoken
+2. Set OPENAI_API_KEY in your environment
+3. Run: python csv_qa.py <path/to/data.csv>
+
+For integration with Next.js, you can call this script from your API route.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sys
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+
+import faiss
+import numpy as np
+import pandas as pd
+import tiktoken
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableParallel, RunnablePassthrough
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _row_cache_path(csv_path: str, cache_dir: str = ".faiss_cache") -> Path:
+    return Path(cache_dir) / f"{Path(csv_path).stem}_rows.parquet"
+
+
+def load_row(csv_path: str, row_index: int, cache_dir: str = ".faiss_cache"):
+    """Fetch the raw values of one CSV row from the parquet row cache."""
+    cache_path = _row_cache_path(csv_path, cache_dir)
+    return pd.read_parquet(cache_path).iloc[row_index].to_dict()
+
+
+def load_csv_data(csv_path: str, cache_dir: str = ".faiss_cache"):
+    """
+    Load a CSV file into one Document per row.
+
+    page_content holds "column: value" lines for the non-null cells of
+    the row, built from one to_dict(orient="records") pass. Metadata
+    carries only the row index and source path — the raw values live in
+    a parquet sidecar and are fetched on demand with load_row, instead of
+    being duplicated as strings in every document.
+    """
+    logger.info("Loading CSV from: %s", csv_path)
+    # The pyarrow reader parses multi-threaded and keeps strings Arrow-backed
+    # instead of one Python object per cell
+    df = pd.read_csv(csv_path, engine="pyarrow", dtype_backend="pyarrow")
+
+    # Mandi CSVs are dominated by low-cardinality text (market, commodity,
+    # state, ...); storing those as categoricals keeps one copy per distinct
+    # value rather than one per row
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col]):
+            if df[col].nunique(dropna=True) <= len(df) // 2:
+                df[col] = df[col].astype("category")
+
+    logger.info("Loaded %d rows, %d columns", len(df), len(df.columns))
+
+    cache_path = _row_cache_path(csv_path, cache_dir)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(cache_path)
+
+    # Single bulk conversion; object dtype is required so nulls stay None
+    # (str-dtype columns would coerce them back to NaN)
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+    documents = []
+    for i, record in enumerate(records):
+        page_content = "\n".join(
+            f"{k}: {v}" for k, v in record.items() if v is not None
+        )
+        documents.append(Document(
+            page_content=page_content,
+            metadata={"row_index": i, "source": csv_path},
+        ))
+
+    logger.info("Created %d documents", len(documents))
+    return documents
+
+
+async def create_vectorstore(documents, csv_path: str, cache_dir: str = ".faiss_cache"):
+    """
+    Split the documents and index them in a FAISS vector store.
+
+    The index is persisted under cache_dir keyed by the CSV content hash,
+    so an unchanged CSV is reloaded from disk instead of re-embedded —
+    embedding is the dominant cost (and the only paid one) of a cold start.
+    """
+    # Query embeddings are cached on disk too: re-asked (or pre-warmed)
+    # questions skip the per-query OpenAI embedding call entirely.
+    base_embeddings = OpenAIEmbeddings(chunk_size=1000, max_retries=6)
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        base_embeddings,
+        LocalFileStore(str(Path(cache_dir) / "embeddings")),
+        namespace=base_embeddings.model,
+        query_embedding_cache=True,
+    )
+
+    key = hashlib.sha256(Path(csv_path).read_bytes()).hexdigest()[:16]
+    index_path = Path(cache_dir) / f"faiss_{key}"
+    if index_path.exists():
+        logger.info("Loading cached FAISS index from: %s", index_path)
+        return FAISS.load_local(
+            str(index_path), embeddings, allow_dangerous_deserialization=True
+        )
+
+    # CSV row documents are almost always under the chunk size already;
+    # only run the recursive splitter on the rare oversized ones.
+    chunk_size = 1000
+    short_docs = [d for d in documents if len(d.page_content) <= chunk_size]
+    long_docs = [d for d in documents if len(d.page_content) > chunk_size]
+    split_docs = short_docs
+    if long_docs:
+        # Measure chunks in tokens (what the embedding model actually
+        # counts) instead of characters; the lru_cache keeps the splitter
+        # from re-encoding the same split on every merge step. Row text
+        # under 1000 chars typically sits far below 800 tokens, so the
+        # pass-through docs above are effectively never oversized.
+        enc = tiktoken.get_encoding("cl100k_base")
+
+        @lru_cache(maxsize=100_000)
+        def _token_len(text: str) -> int:
+            return len(enc.encode(text))
+
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=800,
+            chunk_overlap=100,
+            length_function=_token_len,
+        )
+        split_docs = split_docs + text_splitter.split_documents(long_docs)
+    logger.info("Split into %d chunks", len(split_docs))
+
+    # Embedding is network-bound: large per-request batches plus the async
+    # client let requests overlap instead of running one HTTP call at a time.
+    texts = [doc.page_content for doc in split_docs]
+    metadatas = [doc.metadata for doc in split_docs]
+    vectors = np.asarray(
+        await embeddings.aembed_documents(texts), dtype=np.float32
+    )
+
+    # HNSW graph search instead of the default exhaustive IndexFlatL2:
+    # query cost goes from O(N) to roughly O(log N) with negligible
+    # recall loss, which matters once the CSV runs to tens of thousands
+    # of rows. Vectors are stored int8 scalar-quantized, cutting index
+    # memory ~4x versus FP32 and speeding up distance computation.
+    index = faiss.IndexHNSWSQ(vectors.shape[1], faiss.ScalarQuantizer.QT_8bit, 32)
+    index.hnsw.efConstruction = 200
+    index.hnsw.efSearch = 64
+    # The scalar quantizer learns per-dimension ranges; a 10k sample is plenty
+    index.train(vectors[:10000])
+
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore({}),
+        index_to_docstore_id={},
+    )
+    vectorstore.add_embeddings(zip(texts, vectors), metadatas=metadatas)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    vectorstore.save_local(str(index_path))
+    logger.info("Vector store ready (cached at %s)", index_path)
+    return vectorstore
+
+
+def create_qa_chain(vectorstore):
+    """
+    Build the retrieval QA chain on top of the vector store.
+
+    The chain retrieves once and fans the documents out to both the
+    answer generation and the caller: invoke returns a dict with the
+    generated "answer" and the retrieved "docs".
+    """
+    retriever = vectorstore.as_retriever(search_kwargs={"k": 4})
+
+    prompt = ChatPromptTemplate.from_template(
+        "Answer the question using only the context below. "
+        "If the context does not contain the answer, say so.\n\n"
+        "Context:\n{context}\n\n"
+        "Question: {question}\n"
+    )
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, streaming=True)
+
+    def format_docs(docs):
+        return "\n\n".join(doc.page_content for doc in docs)
+
+    answer_chain = (
+        RunnablePassthrough.assign(context=lambda x: format_docs(x["docs"]))
+        | prompt
+        | llm
+        | StrOutputParser()
+    )
+    qa_chain = RunnableParallel(
+        {"docs": retriever, "question": RunnablePassthrough()}
+    ).assign(answer=answer_chain)
+    return qa_chain
+
+
+async def main():
+    if len(sys.argv) != 2:
+        print("Usage: python csv_qa.py <path/to/data.csv>")
+        print("Example: python csv_qa.py mandi_price_train.csv")
+        sys.exit(1)
+
+    csv_path = sys.argv[1]
+    documents = load_csv_data(csv_path)
+    vectorstore = await create_vectorstore(documents, csv_path)
+    qa_chain = create_qa_chain(vectorstore)
+    # Used only to pre-warm retrieval (and the query-embedding cache)
+    # for queued questions while the current answer is still streaming.
+    retriever = vectorstore.as_retriever(search_kwargs={"k": 4})
+
+    print("Ask questions about the CSV (type 'quit' to exit).")
+    print("Separate several questions with ';' to queue them.")
+    pending = deque()
+    while True:
+        if not pending:
+            try:
+                # input() runs in a worker thread so the event loop stays free
+                line = await asyncio.to_thread(input, "\n> ")
+            except (EOFError, KeyboardInterrupt):
+                break
+            pending.extend(q.strip() for q in line.split(";") if q.strip())
+            continue
+
+        question = pending.popleft()
+        if question.lower() in ("quit", "exit"):
+            break
+
+        # While this answer streams from the LLM, overlap the next queued
+        # question's retrieval so its embedding and vector search are
+        # already warm when its turn comes.
+        prefetch = None
+        if pending and pending[0].lower() not in ("quit", "exit"):
+            prefetch = asyncio.create_task(retriever.ainvoke(pending[0]))
+
+        logger.info("Processing question: %s", question)
+        # Print tokens as they arrive instead of waiting for the full
+        # completion; stream chunks are partial {"docs"/"answer"} dicts.
+        print()
+        docs = []
+        async for chunk in qa_chain.astream(question):
+            if "docs" in chunk:
+                docs = chunk["docs"]
+            if "answer" in chunk:
+                print(chunk["answer"], end="", flush=True)
+        print()
+        print(f"\n(based on {len(docs)} matching rows)")
+
+        if prefetch is not None:
+            await prefetch
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,7 +6,7 @@ This script can be used as an alternative to the Node.js implementation.
 It uses the official Google Earth Engine Python API.
 
 SETUP:
-1. Install: pip install earthengine-api google-auth
+1. Install: pip install earthengine-api google-auth numpy
 2. Authenticate: earthengine authenticate
 3. Run: python gee_crop_fetcher.py <latitude> <longitude>
 
@@ -16,6 +16,7 @@ For integration with Next.js, you can call this script from your API route.
 import sys
 import json
 import ee
+import numpy as np
 
 # Initialize Earth Engine
 try:
@@ -46,11 +47,12 @@ def get_crop_data(latitude: float, longitude: float, radius_meters: int = 5000):
     # MCD12Q1: MODIS Land Cover Type Yearly Global 500m
     modis = ee.ImageCollection('MODIS/006/MCD12Q1')
     
-    # Get the most recent year available
-    latest_year = modis.aggregate_max('system:time_start').getInfo()
+    # Get the most recent year available (kept server-side; resolving it
+    # here with getInfo() would cost an extra round-trip)
+    latest_year = ee.Date(modis.aggregate_max('system:time_start'))
     latest_image = modis.filterDate(
-        ee.Date(latest_year).format('YYYY'),
-        ee.Date(latest_year).add(1, 'year').format('YYYY')
+        latest_year.format('YYYY'),
+        latest_year.advance(1, 'year').format('YYYY')
     ).first()
     
     # Select the land cover classification band
@@ -69,9 +71,15 @@ def get_crop_data(latitude: float, longitude: float, radius_meters: int = 5000):
         maxPixels=1e9
     )
     
-    # Get total area
-    total_area = roi.area().getInfo()  # in square meters
-    cropland_area = area_stats.get('LC_Type1').getInfo() or 0
+    # Evaluate everything in one server-side dictionary: a single
+    # getInfo() round-trip instead of one per value
+    summary = ee.Dictionary({
+        'year': latest_year.format('YYYY'),
+        'cropland_area': area_stats.get('LC_Type1', 0),
+        'total_area': roi.area()  # in square meters
+    }).getInfo()
+    total_area = summary['total_area']
+    cropland_area = summary['cropland_area'] or 0
     
     # For more detailed crop classification, you can use:
     # 1. Sentinel-2 imagery with machine learning models
@@ -95,7 +103,7 @@ def get_crop_data(latitude: float, longitude: float, radius_meters: int = 5000):
             "longitude": longitude
         },
         "metadata": {
-            "year": str(ee.Date(latest_year).format('YYYY').getInfo()),
+            "year": str(summary['year']),
             "source": "Google Earth Engine - MODIS MCD12Q1",
             "cropland_area_m2": cropland_area,
             "total_area_m2": total_area,
@@ -104,95 +112,216 @@ def get_crop_data(latitude: float, longitude: float, radius_meters: int = 5000):
     }
 
 
+def get_crop_data_batch(points, radius_meters: int = 5000):
+    """
+    Fetch crop data for several locations in a single Earth Engine request.
+
+    Args:
+        points: List of (latitude, longitude) pairs
+        radius_meters: Radius around each point to analyze (default: 5000m = 5km)
+
+    Returns:
+        List of dictionaries with crop data, in the same order as points
+    """
+    # One feature per buffered point; the index lets us restore input order
+    features = [
+        ee.Feature(
+            ee.Geometry.Point([lon, lat]).buffer(radius_meters),
+            {'point_index': i, 'latitude': lat, 'longitude': lon}
+        )
+        for i, (lat, lon) in enumerate(points)
+    ]
+    fc = ee.FeatureCollection(features)
+
+    # Same MODIS cropland mask as get_crop_data
+    modis = ee.ImageCollection('MODIS/006/MCD12Q1')
+    latest_year = ee.Date(modis.aggregate_max('system:time_start'))
+    latest_image = modis.filterDate(
+        latest_year.format('YYYY'),
+        latest_year.advance(1, 'year').format('YYYY')
+    ).first()
+    land_cover = latest_image.select('LC_Type1')
+    croplands = land_cover.eq(12).Or(land_cover.eq(14))
+
+    # reduceRegions sums cropland area over every buffer server-side —
+    # one round-trip for N points instead of one per point
+    reduced = croplands.multiply(ee.Image.pixelArea()).reduceRegions(
+        collection=fc,
+        reducer=ee.Reducer.sum(),
+        scale=500  # MODIS resolution
+    ).map(lambda f: f.set('total_area', f.geometry().area()))
+
+    summary = ee.Dictionary({
+        'year': latest_year.format('YYYY'),
+        'features': reduced
+    }).getInfo()
+
+    year = str(summary['year'])
+    results = []
+    for feature in sorted(
+        summary['features']['features'],
+        key=lambda f: f['properties']['point_index']
+    ):
+        props = feature['properties']
+        latitude = props['latitude']
+        longitude = props['longitude']
+        cropland_area = props.get('sum') or 0
+        total_area = props.get('total_area') or 0
+        cropland_percentage = (cropland_area / total_area * 100) if total_area > 0 else 0
+
+        results.append({
+            "crops": estimate_crop_distribution(latitude, longitude, cropland_area),
+            "location": {
+                "latitude": latitude,
+                "longitude": longitude
+            },
+            "metadata": {
+                "year": year,
+                "source": "Google Earth Engine - MODIS MCD12Q1",
+                "cropland_area_m2": cropland_area,
+                "total_area_m2": total_area,
+                "cropland_percentage": round(cropland_percentage, 2)
+            }
+        })
+
+    return results
+
+
+# Regional crop patterns (typical percentages)
+CROP_PATTERNS = {
+    "north": [
+        {"name": "Wheat", "percentage": 35.2, "season": "Rabi"},
+        {"name": "Rice", "percentage": 27.6, "season": "Kharif"},
+        {"name": "Sugarcane", "percentage": 11.8, "season": "Year-round"},
+        {"name": "Cotton", "percentage": 9.0, "season": "Kharif"},
+        {"name": "Maize", "percentage": 7.9, "season": "Kharif"},
+        {"name": "Mustard", "percentage": 5.6, "season": "Rabi"},
+        {"name": "Others", "percentage": 2.9}
+    ],
+    "south": [
+        {"name": "Rice", "percentage": 42.5, "season": "Kharif"},
+        {"name": "Coconut", "percentage": 19.0, "season": "Year-round"},
+        {"name": "Sugarcane", "percentage": 14.5, "season": "Year-round"},
+        {"name": "Cotton", "percentage": 10.6, "season": "Kharif"},
+        {"name": "Groundnut", "percentage": 7.0, "season": "Kharif"},
+        {"name": "Ragi", "percentage": 3.4, "season": "Kharif"},
+        {"name": "Others", "percentage": 0.9}
+    ],
+    "east": [
+        {"name": "Rice", "percentage": 51.2, "season": "Kharif"},
+        {"name": "Jute", "percentage": 11.8, "season": "Kharif"},
+        {"name": "Wheat", "percentage": 10.7, "season": "Rabi"},
+        {"name": "Potato", "percentage": 9.0, "season": "Rabi"},
+        {"name": "Maize", "percentage": 7.9, "season": "Kharif"},
+        {"name": "Pulses", "percentage": 5.1, "season": "Rabi"},
+        {"name": "Others", "percentage": 1.4}
+    ],
+    "west": [
+        {"name": "Cotton", "percentage": 31.5, "season": "Kharif"},
+        {"name": "Sugarcane", "percentage": 23.1, "season": "Year-round"},
+        {"name": "Wheat", "percentage": 19.1, "season": "Rabi"},
+        {"name": "Rice", "percentage": 11.8, "season": "Kharif"},
+        {"name": "Groundnut", "percentage": 7.9, "season": "Kharif"},
+        {"name": "Bajra", "percentage": 3.4, "season": "Kharif"},
+        {"name": "Others", "percentage": 0.8}
+    ],
+    "central": [
+        {"name": "Wheat", "percentage": 40.0, "season": "Rabi"},
+        {"name": "Rice", "percentage": 27.6, "season": "Kharif"},
+        {"name": "Soybean", "percentage": 14.6, "season": "Kharif"},
+        {"name": "Cotton", "percentage": 9.0, "season": "Kharif"},
+        {"name": "Pulses", "percentage": 5.6, "season": "Rabi"},
+        {"name": "Maize", "percentage": 3.4, "season": "Kharif"},
+        {"name": "Others", "percentage": 0}
+    ]
+}
+
+
+def _freeze_pattern(crops):
+    """Unpack one regional pattern into frozen parallel structures."""
+    percentages = np.array([crop["percentage"] for crop in crops], dtype=np.float64)
+    # Fold percentage -> fraction (/100) and m^2 -> hectares (/10000)
+    # into one constant so the hot path is a single multiply
+    fractions = percentages / 1_000_000
+    percentages.setflags(write=False)
+    fractions.setflags(write=False)
+    return (
+        tuple(crop["name"] for crop in crops),
+        percentages,
+        fractions,
+        tuple(crop.get("season") for crop in crops),
+    )
+
+
+# Names, percentages, hectare fractions, and seasons precomputed at
+# import so the per-call area computation is one vectorized multiply
+PATTERN_ARRAYS = {
+    region: _freeze_pattern(crops) for region, crops in CROP_PATTERNS.items()
+}
+
+
+def _region_name(lat_gt_28, lat_lt_20, lon_gt_80, lon_gt_78, lon_gt_75):
+    """Original region decision tree, used only to fill REGION_TABLE."""
+    if lat_gt_28:
+        return "north" if lon_gt_80 else "east"
+    if lat_lt_20:
+        return "south" if lon_gt_78 else "west"
+    return "east" if lon_gt_80 else ("central" if lon_gt_75 else "west")
+
+
+# Branchless region lookup: the five lat/lon comparisons index a
+# precomputed 32-entry table instead of walking an if/elif cascade.
+REGION_TABLE = tuple(
+    _region_name(bool(i & 16), bool(i & 8), bool(i & 4), bool(i & 2), bool(i & 1))
+    for i in range(32)
+)
+
+
 def estimate_crop_distribution(lat: float, lon: float, total_cropland_area: float):
     """
     Estimate crop distribution based on region and typical crop patterns in India.
     In production, this would use actual crop classification from satellite imagery.
     """
-    # Determine region
-    if lat > 28:
-        region = "north" if lon > 80 else "east"
-    elif lat < 20:
-        region = "south" if lon > 78 else "west"
-    else:
-        region = "east" if lon > 80 else ("central" if lon > 75 else "west")
-    
-    # Regional crop patterns (typical percentages)
-    crop_patterns = {
-        "north": [
-            {"name": "Wheat", "percentage": 35.2, "season": "Rabi"},
-            {"name": "Rice", "percentage": 27.6, "season": "Kharif"},
-            {"name": "Sugarcane", "percentage": 11.8, "season": "Year-round"},
-            {"name": "Cotton", "percentage": 9.0, "season": "Kharif"},
-            {"name": "Maize", "percentage": 7.9, "season": "Kharif"},
-            {"name": "Mustard", "percentage": 5.6, "season": "Rabi"},
-            {"name": "Others", "percentage": 2.9}
-        ],
-        "south": [
-            {"name": "Rice", "percentage": 42.5, "season": "Kharif"},
-            {"name": "Coconut", "percentage": 19.0, "season": "Year-round"},
-            {"name": "Sugarcane", "percentage": 14.5, "season": "Year-round"},
-            {"name": "Cotton", "percentage": 10.6, "season": "Kharif"},
-            {"name": "Groundnut", "percentage": 7.0, "season": "Kharif"},
-            {"name": "Ragi", "percentage": 3.4, "season": "Kharif"},
-            {"name": "Others", "percentage": 0.9}
-        ],
-        "east": [
-            {"name": "Rice", "percentage": 51.2, "season": "Kharif"},
-            {"name": "Jute", "percentage": 11.8, "season": "Kharif"},
-            {"name": "Wheat", "percentage": 10.7, "season": "Rabi"},
-            {"name": "Potato", "percentage": 9.0, "season": "Rabi"},
-            {"name": "Maize", "percentage": 7.9, "season": "Kharif"},
-            {"name": "Pulses", "percentage": 5.1, "season": "Rabi"},
-            {"name": "Others", "percentage": 1.4}
-        ],
-        "west": [
-            {"name": "Cotton", "percentage": 31.5, "season": "Kharif"},
-            {"name": "Sugarcane", "percentage": 23.1, "season": "Year-round"},
-            {"name": "Wheat", "percentage": 19.1, "season": "Rabi"},
-            {"name": "Rice", "percentage": 11.8, "season": "Kharif"},
-            {"name": "Groundnut", "percentage": 7.9, "season": "Kharif"},
-            {"name": "Bajra", "percentage": 3.4, "season": "Kharif"},
-            {"name": "Others", "percentage": 0.8}
-        ],
-        "central": [
-            {"name": "Wheat", "percentage": 40.0, "season": "Rabi"},
-            {"name": "Rice", "percentage": 27.6, "season": "Kharif"},
-            {"name": "Soybean", "percentage": 14.6, "season": "Kharif"},
-            {"name": "Cotton", "percentage": 9.0, "season": "Kharif"},
-            {"name": "Pulses", "percentage": 5.6, "season": "Rabi"},
-            {"name": "Maize", "percentage": 3.4, "season": "Kharif"},
-            {"name": "Others", "percentage": 0}
-        ]
-    }
-    
-    pattern = crop_patterns.get(region, crop_patterns["central"])
-    
-    # Convert percentages to actual areas
-    crops = []
-    for crop in pattern:
-        area = (total_cropland_area * crop["percentage"] / 100) / 10000  # Convert to hectares
-        crops.append({
-            "name": crop["name"],
-            "area": round(area, 2),
-            "percentage": crop["percentage"],
-            "season": crop.get("season")
-        })
-    
-    return crops
+    # Determine region via the precomputed lookup table
+    region = REGION_TABLE[
+        (lat > 28) << 4 | (lat < 20) << 3 | (lon > 80) << 2
+        | (lon > 78) << 1 | (lon > 75)
+    ]
+
+    names, percentages, fractions, seasons = PATTERN_ARRAYS.get(
+        region, PATTERN_ARRAYS["central"]
+    )
+
+    # Convert to actual areas (hectares): one multiply per call, the
+    # percentage and hectare divisions were folded in at import
+    areas = fractions * total_cropland_area
+
+    return [
+        {
+            "name": name,
+            "area": round(float(area), 2),
+            "percentage": float(percentage),
+            "season": season
+        }
+        for name, area, percentage, season in zip(names, areas, percentages, seasons)
+    ]
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python gee_crop_fetcher.py <latitude> <longitude>")
+    args = sys.argv[1:]
+    if len(args) < 2 or len(args) % 2 != 0:
+        print("Usage: python gee_crop_fetcher.py <latitude> <longitude> [<latitude> <longitude> ...]")
         print("Example: python gee_crop_fetcher.py 28.7041 77.1025")
         sys.exit(1)
-    
+
     try:
-        lat = float(sys.argv[1])
-        lon = float(sys.argv[2])
-        
-        result = get_crop_data(lat, lon)
+        coords = [float(a) for a in args]
+        points = list(zip(coords[0::2], coords[1::2]))
+
+        if len(points) == 1:
+            result = get_crop_data(*points[0])
+        else:
+            result = get_crop_data_batch(points)
         print(json.dumps(result, indent=2))
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)